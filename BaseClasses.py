@@ -1,123 +1,481 @@
+import array
 import copy
-import inspect
+import copyreg
+import functools
+import keyword
+import operator
+import sys
 
-class EntryBase:
+# numpy, numba and pyarrow are optional: they are only needed for the fast integer search and the to_numpy/to_arrow exports.
+# They are also slow to import, so they are only imported (and the kernel compiled) the first time they are needed
+prange = None  # numba.prange, set by _get_int_kernel
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy():
+    """Returns the numpy module, or None if it isn't installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _match_int(col, value, mask):
+    """Keep in 'mask' only the rows where 'col' equals 'value', in a single pass over the column (compiled by numba)."""
+    for i in prange(col.shape[0]):
+        mask[i] &= col[i] == value
+
+@functools.lru_cache(maxsize=None)
+def _get_int_kernel():
+    """Returns _match_int compiled with numba, or None if numba (or numpy) isn't installed."""
+    global prange
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    return njit(cache=True, parallel=True)(_match_int)
+
+
+def _reduce_entry_class(cls):
+    """Pickle classes created by EntryBase.make as a call to make, and any other entry class by name as usual."""
+    if '_made_from' in cls.__dict__:
+        base, attributes = cls._made_from
+        return base.make, (attributes,)
+    return cls.__qualname__
+
+
+_KERNEL_MIN_ROWS = 5000  # below this, calling the numba kernel costs more than comparing in python
+_INT_TYPECODES = 'bBhHiIlLqQ'  # array typecodes allowed in BookBase.COLUMN_TYPECODES
+
+
+class EntryMeta(type):
+    """Metaclass for entries. Turns the 'attributes' declared in the class body into __slots__,
+    so that instances have no __dict__ and only the selected attributes can be set."""
+    def __new__(mcls, name, bases, namespace):
+        namespace['__slots__'] = tuple(namespace.get('attributes', ()))
+        cls = super().__new__(mcls, name, bases, namespace)
+        # Instances can't hold the full attribute tuple anymore, so compute it once and keep it on the class
+        cls._all_attributes = cls.attributes = cls._get_all_attributes()
+        cls._attr_set = frozenset(cls._all_attributes)  # for fast membership checks
+        mcls._check_attribute_names(cls)
+        # Every class gets its own generated init, which EntryBase.__init__ forwards to. That way custom __init__ methods can
+        # call super().__init__(...), and their child classes still get their own attributes set
+        cls._generated_init = mcls._create_init(cls)
+        cls._has_generated_init = mcls._is_generated(cls.__init__)  # no custom __init__ in the hierarchy
+        # Same for __repr__: keep a custom one inherited from a parent
+        if '__repr__' not in namespace and (cls.__repr__ is EntryBase.__repr__ or mcls._is_generated(cls.__repr__)):
+            cls.__repr__ = mcls._create_repr(cls)
+        cls._row_getter = mcls._create_row_getter(cls._all_attributes)
+        return cls
+    
+    @staticmethod
+    def _is_generated(func):
+        return getattr(func, '_generated', False)
+    
+    @staticmethod
+    def _create_row_getter(attrs):
+        """Return a function that gives the tuple of values of an entry, using a (C implemented) attrgetter."""
+        if len(attrs) > 1:
+            return operator.attrgetter(*attrs)
+        if len(attrs) == 1:
+            getter = operator.attrgetter(attrs[0])
+            return lambda entry: (getter(entry),)
+        return lambda entry: ()
+    
+    @staticmethod
+    def _check_attribute_names(cls):
+        """The attributes are used as names in the generated __init__ and __repr__, so they can't be keywords, 'self' or repeated."""
+        for attr in cls._all_attributes:
+            if keyword.iskeyword(attr) or attr == 'self':
+                raise TypeError(f"{cls.__name__} can't use '{attr}' as an attribute name")
+        if len(cls._attr_set) != len(cls._all_attributes):
+            raise TypeError(f"{cls.__name__} has repeated attributes: {cls._all_attributes}")
+    
+    @staticmethod
+    def _create_init(cls):
+        """Generate an __init__ with one parameter per attribute (like namedtuple/dataclass do), so
+        argument checking is done by python itself instead of by hand on every instance creation."""
+        params = ''.join(f', {attr}' for attr in cls._all_attributes)
+        body = ''.join(f'\n    self.{attr} = {attr}' for attr in cls._all_attributes) or '\n    pass'
+        namespace = {}
+        exec(f'def __init__(self{params}):{body}', namespace)
+        
+        init = namespace['__init__']
+        init.__qualname__ = f'{cls.__qualname__}.__init__'
+        init.__doc__ = f"Create a {cls.__name__} with the attributes {cls._all_attributes}"
+        init._generated = True
+        return init
+    
+    @staticmethod
+    def _create_repr(cls):
+        """Generate a __repr__ that formats all the attributes with a single f-string."""
+        fields = ', '.join(f'{attr}={{self.{attr}}}' for attr in cls._all_attributes)
+        namespace = {'_class_name': cls.__name__}
+        exec(f"def __repr__(self):\n    return f'{{_class_name}}({fields})'", namespace)
+        
+        repr_ = namespace['__repr__']
+        repr_.__qualname__ = f'{cls.__qualname__}.__repr__'
+        repr_._generated = True
+        return repr_
+
+
+copyreg.pickle(EntryMeta, _reduce_entry_class)
+
+
+class EntryBase(metaclass=EntryMeta):
     """This serves as the base class for entries.
     It includes pretty printing and limitations to possible attributes.
     When inheriting, simply include in 'attributes' the variables that you want to add to this class (not in parent classes already)"""
-    _can_set_any_attr = True
     attributes = ()
     
+    def __init__(self, *args, **kwargs):
+        """Create instance with the proper attributes automatically, by forwarding to the init generated for this class.
+        Child classes with their own __init__ can call super().__init__(...) with the values to store."""
+        self._generated_init(*args, **kwargs)
+    __init__._generated = True  # It does nothing more than the generated init
+    
     @classmethod
     def _get_parent_hierarchy_with_attributes(cls):
-        base_classes = [base for base in inspect.getmro(cls) if (hasattr(base, 'attributes'))]
+        base_classes = [base for base in cls.__mro__ if '__slots__' in base.__dict__]
         return base_classes[::-1]
     
     @classmethod
     def _get_all_attributes(cls):
         base_classes = cls._get_parent_hierarchy_with_attributes()
         # Using tuples and summing in this order, allows us to keep the proper attribute order from Base -> Parent -> Child
-        return sum((base.attributes for base in base_classes), start=())
+        return sum((base.__slots__ for base in base_classes), start=())
+    
+    @classmethod
+    def make(cls, attributes):
+        """Returns a child class that adds the given 'attributes', for schemas only known at runtime.
+        The classes are cached, so asking again for the same attributes returns the same class without generating it again.
+        They can also be pickled: they are rebuilt by calling make again when unpickled."""
+        return cls._make(tuple(attributes))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _make(cls, attributes):
+        if (repeated := [attr for ix, attr in enumerate(attributes) if attr in cls._attr_set or attr in attributes[:ix]]):  #  python 3.8 syntax only!
+            raise TypeError(f"{cls.__name__} can't add the attribute(s) {repeated}, they are repeated")
         
+        new = type(cls)(f"{cls.__name__}[{', '.join(attributes)}]", (cls,), {'attributes': attributes})
+        new._made_from = (cls, attributes)
+        return new
     
-    def __new__(cls, *args, **kwargs):
-        """Update attributes to include from parent classes"""
-        instance = super().__new__(cls)
-        instance.attributes = cls._get_all_attributes()
-        instance._can_set_any_attr = False
+    @classmethod
+    def _from_row(cls, row):
+        """Build an instance from values that were already through __init__ (one per attribute, in order).
+        A custom __init__ may change the values it receives, so this only stores them, with the generated init."""
+        instance = cls.__new__(cls)
+        cls._generated_init(instance, *row)
         return instance
     
+    def __reduce__(self):
+        """Pickle entries as their row of values (slotted classes can't use the default protocol 0/1 pickling)."""
+        return self.__class__._from_row, (self.__class__._row_getter(self),)
     
-    def __init__(self, *args, **kwargs):
-        """Create instance with the proper attributes automatically. Basically just imitates __init__ but with automatic variables"""
-        if len(args) > len(self.attributes):
-            raise TypeError(f"Received too many (non-positional) arguments")
-        
-        # Create mapping of {args: attributes}
-        dict_args = dict(zip(self.attributes, args))
-        
-        # Raise error if repeated assignments to attributes
-        if (common_args := (dict_args.keys() & kwargs)):   #  python 3.8 syntax only!
-            raise TypeError(f"{self.__class__.__name__}'s init got multiple values for argument(s): {common_args}")
-        
-        kwargs.update(dict_args)  # Merge the two dictionaries
-        
-        if (set(self.attributes) != kwargs.keys()):  # Invalid args
-            # Check for missing arguments:
-            if (missing_args := (set(self.attributes) - kwargs.keys())):    #  python 3.8 syntax only!
-                raise TypeError(f"{self.__class__.__name__}'s init is missing the following argument(s): {missing_args}")
-
-            # Check of extra arguments:
-            if (unexpected_args := (kwargs.keys() - self.attributes)):  #  python 3.8 syntax only!
-                raise TypeError(f"{self.__class__.__name__}'s init received unexpected argument(s): {unexpected_args}")
-                
-            raise TypeError("Unexpected Error")
-        
-        
-        else:  # Correct args, so add them
-            self.__dict__.update(kwargs)
-    
+    def __deepcopy__(self, memo):
+        """Copy the attributes straight into a new instance instead of going through the generic reduce machinery."""
+        # immutable values (str, int) are returned as is by deepcopy
+        return self._from_row([copy.deepcopy(getattr(self, attr), memo) for attr in self._all_attributes])
     
-        
-    def __setattr__(self, name, value):
-        """Limit settting attributes to those selected"""
-        # This can still be broken by using __dict__. Couldn't find a way to lock that without the usage of __slots__, or replacing __dict__ with my own class
-        if self._can_set_any_attr or name in self.attributes:
-            super().__setattr__(name, value)
-        else:
-            raise AttributeError(f"Unable to set '{name}' for class {self.__class__.__name__}")
-            
     def __getitem__(self, key):
         """Allow getting attributes using a index like notation."""
-        if key in self.attributes:
-            return self.__getattribute__(key)
+        if key in self._attr_set:
+            return getattr(self, key)
         else:
             raise AttributeError(f"'{self.__class__.__name__}' has no attribute '{key}'")
     
     def __str__(self):
-        return '\n'.join(f'{attr}: {self[attr]}' for attr in self.attributes)
+        return '\n'.join([f'{attr}: {getattr(self, attr)}' for attr in self._all_attributes])
         
     def __repr__(self):
-        return f'{self.__class__.__name__}({", ".join(f"{attr}={self[attr]}" for attr in self.attributes)})'
+        return f'{self.__class__.__name__}({", ".join(f"{attr}={getattr(self, attr)}" for attr in self._all_attributes)})'
     
 
 class BookBase:
     """This serves as the base class for the book entries that we have.
     This already includes most necessary functions and tools, like indexing, searching, adding, printing and copying.
-    When inheriting from it to create phone books, change the 'ENTRY_TYPE' variable to the entry class desired."""
+    When inheriting from it to create phone books, change the 'ENTRY_TYPE' variable to the entry class desired.
+    Entries are stored column-wise (one list per attribute), and entry objects are only built when they are returned,
+    so changing an entry returned by the book doesn't change the book itself.
+    String attributes with few distinct values (like names) can be added to 'INTERN_ATTRIBUTES', so that their values
+    are interned and comparing them when searching is mostly a pointer comparison.
+    Integer attributes can be given an integer array typecode in 'COLUMN_TYPECODES' (e.g. {'age': 'q'}), so that they are stored
+    as machine integers in an array.array instead of as python objects in a list (they then only accept integers)."""
     ENTRY_TYPE = EntryBase
-    attributes = None # this will be filled later with ENTRY_TYPE._get_all_attributes()
+    INTERN_ATTRIBUTES = ()
+    COLUMN_TYPECODES = {}
+    attributes = None # this will be filled later with ENTRY_TYPE._all_attributes
     
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
-        instance.attributes = cls.ENTRY_TYPE._get_all_attributes()
+        instance.attributes = cls.ENTRY_TYPE._all_attributes
+        instance._intern_positions = tuple(ix for ix, attr in enumerate(instance.attributes) if attr in cls.INTERN_ATTRIBUTES)
         return instance
     
     def __init__(self):
-        self.entries = []
+        for attr, typecode in self.COLUMN_TYPECODES.items():
+            if attr not in self.attributes:
+                raise AttributeError(f"'{self.ENTRY_TYPE.__name__}' has no attribute '{attr}'")
+            # Only integers are stored exactly, so that the stored values are the same as the ones given (and indexed)
+            if typecode not in _INT_TYPECODES:
+                raise ValueError(f"Column '{attr}' has typecode '{typecode}', but only integer typecodes are supported: {_INT_TYPECODES}")
+        
+        self._cols = {attr: array.array(self.COLUMN_TYPECODES[attr]) if attr in self.COLUMN_TYPECODES else []
+                      for attr in self.attributes}
+        self._length = 0
+        self._indexes = {}  # {attr: {value: [row indices]}}, only for the attributes passed to create_index
+        self._unique_indexes = {}  # {attr: {value: row index}}, only for the attributes passed to create_unique_index
+        
+    @property
+    def entries(self):
+        """List with all the entries of the book, in insertion order."""
+        return [self._entry_view(ix) for ix in range(self._length)]
+        
+    def _entry_view(self, ix):
+        """Build the entry stored in row 'ix' of the columns."""
+        return self.ENTRY_TYPE._from_row([col[ix] for col in self._cols.values()])
+    
+    def _get_column(self, attr):
+        try:
+            return self._cols[attr]
+        except KeyError:
+            raise AttributeError(f"'{self.ENTRY_TYPE.__name__}' has no attribute '{attr}'") from None
         
     def add_contact(self, *args, **kwargs):
         """Add a contact to the book. The args/kwargs required are defined by the ENTRY_TYPE."""
-        self.entries.append(self.ENTRY_TYPE(*args, **kwargs))
+        if not kwargs and len(args) == len(self.attributes) and self.ENTRY_TYPE._has_generated_init:
+            # The generated __init__ would just store the values as given, so there is no need to build the entry
+            self._append_row(args)
+            return
+        
+        entry = self.ENTRY_TYPE(*args, **kwargs)  # Let the entry validate the arguments
+        self._append_row(self.ENTRY_TYPE._row_getter(entry))
+    
+    def _append_row(self, row):
+        """Append a row (one value per attribute, in order) to the columns and indexes."""
+        if self._intern_positions:
+            row = self._intern_row(row)
+        self._check_indexable((row,))
+        self._check_unique((row,))
+        try:
+            for col, value in zip(self._cols.values(), row):
+                col.append(value)  # typed columns raise for values that don't fit them
+        except (TypeError, OverflowError):
+            self._truncate_columns()
+            raise
+        self._add_to_indexes((row,))
+        self._length += 1
+    
+    def add_contacts(self, rows):
+        """Add several contacts at once. Each row is a tuple with the values of one contact, in the order of 'attributes'.
+        Much faster than calling add_contact for each of them, as no entry is built (unless the ENTRY_TYPE has its own __init__)."""
+        if self.ENTRY_TYPE._has_generated_init:
+            rows = [tuple(row) for row in rows]
+            for row in rows:
+                if len(row) != len(self.attributes):
+                    raise TypeError(f"Each row must have {len(self.attributes)} values {self.attributes}, got {row}")
+        else:  # The entries need to go through their __init__
+            rows = [self.ENTRY_TYPE._row_getter(self.ENTRY_TYPE(*row)) for row in rows]
+        if self._intern_positions:
+            rows = [self._intern_row(row) for row in rows]
+        self._check_indexable(rows)
+        self._check_unique(rows)
+        try:
+            for col, values in zip(self._cols.values(), zip(*rows)):
+                col.extend(values)
+        except (TypeError, OverflowError):
+            self._truncate_columns()
+            raise
+        self._add_to_indexes(rows)
+        self._length += len(rows)
+    
+    
+    def _truncate_columns(self):
+        """Drop any values past the last full row, left by a row that failed to be added."""
+        for col in self._cols.values():
+            del col[self._length:]
+    
+    def _intern_row(self, row):
+        """Return the row with the strings of the INTERN_ATTRIBUTES interned."""
+        row = list(row)
+        for ix in self._intern_positions:
+            if type(row[ix]) is str:  # sys.intern doesn't accept str subclasses
+                row[ix] = sys.intern(row[ix])
+        return row
+    
+    
+    def create_index(self, attr):
+        """Keep a hash index on 'attr', so that searching by it doesn't need to go through all the entries.
+        Values of indexed attributes must be hashable."""
+        col = self._get_column(attr)
+        index = {}
+        for ix, value in enumerate(col):
+            index.setdefault(value, []).append(ix)
+        self._indexes[attr] = index
+    
+    def create_unique_index(self, attr):
+        """Keep a hash index on 'attr' where each value can only appear once (like a phone number).
+        Searching by it finds the (single) matching entry directly, and adding an entry with a repeated value raises a ValueError."""
+        col = self._get_column(attr)
+        unique = {}
+        for ix, value in enumerate(col):
+            if value in unique:
+                raise ValueError(f"Can't create a unique index on '{attr}', the value {value!r} is repeated")
+            unique[value] = ix
+        self._unique_indexes[attr] = unique
+    
+    def _check_unique(self, rows):
+        """Raise a ValueError if the rows would repeat a value of a unique index (with the book or among themselves)."""
+        for attr, unique in self._unique_indexes.items():
+            pos = self.attributes.index(attr)
+            seen = set()
+            for row in rows:
+                if row[pos] in unique or row[pos] in seen:
+                    raise ValueError(f"There is already an entry with {attr}={row[pos]!r}")
+                seen.add(row[pos])
+    
+    def _check_indexable(self, rows):
+        """Raise a TypeError if the rows have unhashable values for indexed attributes, before anything is changed."""
+        for attr in self._indexes:
+            pos = self.attributes.index(attr)
+            for row in rows:
+                hash(row[pos])
+    
+    def _add_to_indexes(self, rows):
+        """Add the rows (that were just appended to the columns) to the indexes and unique indexes.
+        The values are read back from the columns, so the indexes hold the same values as create_index would."""
+        new_rows = range(self._length, self._length + len(rows))
+        for attr, index in self._indexes.items():
+            col = self._cols[attr]
+            for ix in new_rows:
+                index.setdefault(col[ix], []).append(ix)
+        for attr, unique in self._unique_indexes.items():
+            col = self._cols[attr]
+            for ix in new_rows:
+                unique[col[ix]] = ix
+    
+    def _lookup_index(self, attr, value):
+        """Rows where 'attr' equals 'value' according to the indexes, or None if no index can be used."""
+        try:
+            if attr in self._unique_indexes:
+                ix = self._unique_indexes[attr].get(value)
+                return [] if ix is None else [ix]
+            if attr in self._indexes:
+                return self._indexes[attr].get(value, [])
+        except TypeError:  # unhashable value, so we need to compare it against the column
+            pass
+        return None
                 
         
     def find(self, **kwargs):
         """Find all the entries to match the given (keyword) arguments. Returns a list of matches (or an empty list if no matches were found)"""
-        return [entry for entry in self.entries if all(kwargs[attr] == entry[attr] for attr in kwargs)]  # Same as list(filter(...))
+        return [self._entry_view(ix) for ix in self.find_indices(**kwargs)]
+    
+    def find_indices(self, **kwargs):
+        """Same as find, but returns the indices of the matching entries, so no entry needs to be built.
+        The entries can be retrieved later with book[ix]."""
+        if not kwargs:  # Everything matches
+            return list(range(self._length))
+        
+        # Gather (expected number of matches, attr, column, value, posting list) for each of the criteria
+        criteria = []
+        for attr, value in kwargs.items():
+            col = self._get_column(attr)
+            if attr in self.INTERN_ATTRIBUTES and type(value) is str:  # The stored values were interned, so intern this one too
+                value = sys.intern(value)
+            posting = self._lookup_index(attr, value)
+            criteria.append((self._length if posting is None else len(posting), attr, col, value, posting))
+        criteria.sort(key=lambda criterion: criterion[0])  # Most selective first, so the rows to check shrink fast
+        
+        # Start from the smallest posting list of the indexed attributes, if any
+        matches, checked = range(self._length), set()
+        if criteria and criteria[0][4] is not None:
+            matches, checked = criteria[0][4], {criteria[0][1]}
+        
+        # Otherwise scan the integer columns with numba (if available)
+        if not checked:
+            int_matches, checked = self._scan_int_columns({attr: value for _, attr, _, value, _ in criteria})
+            if checked:
+                matches = int_matches
         
+        for _, attr, col, value, _ in criteria:  # Narrow down the matching rows one column at a time
+            if not matches:
+                break
+            if attr not in checked:
+                matches = [ix for ix in matches if col[ix] == value]
+        return list(matches)
+    
+    def _scan_int_columns(self, kwargs):
+        """Compare the typed (array.array) integer columns against their (integer) values with the numba kernel.
+        Returns the matching rows and the set of attributes that were checked (empty if numba couldn't be used).
+        Plain list columns are left to the python comparison, as converting them to numpy on every search costs more than it saves."""
+        if self._length < _KERNEL_MIN_ROWS or (kernel := _get_int_kernel()) is None:  #  python 3.8 syntax only!
+            return None, set()
+        np = _import_numpy()
+        
+        mask = None
+        checked = set()
+        for attr, value in kwargs.items():
+            col = self._cols[attr]
+            if type(value) is not int or not isinstance(col, array.array):  # bools and floats are left to the python comparison
+                continue
+            col = np.frombuffer(col, dtype=col.typecode)  # a view, no copy
+            if col.dtype.kind not in 'iu' or not np.iinfo(col.dtype).min <= value <= np.iinfo(col.dtype).max:
+                continue
+            if mask is None:
+                mask = np.ones(self._length, dtype=np.bool_)
+            kernel(col, value, mask)
+            checked.add(attr)
         
-        ''' # Use this if we want to return only the first match
-        for entry in self.entries:
-            for (kw, value) in kwargs.items():
-                if entry[kw] != value:  # if kw in self.attributes and entry[kw] != kwargs[kw]:  -> use this if we want to ignore kwords that don't exist
-                    continue
-                return entry
-        '''
+        if not checked:
+            return None, checked
+        return np.flatnonzero(mask).tolist(), checked
+
     
             
     def create_copy(self):
-        """Returns a copy of this book with deepcopies for all the entries."""
-        return copy.deepcopy(self)  # needs to be deepcopy in order to also copy the inner entries
+        """Returns a copy of this book, with its own columns and indexes.
+        The values themselves are shared, which is fine for immutable values like strings and numbers."""
+        new = copy.copy(self)
+        new._cols = {attr: col[:] for attr, col in self._cols.items()}
+        new._indexes = {attr: {value: posting.copy() for value, posting in index.items()}
+                        for attr, index in self._indexes.items()}
+        new._unique_indexes = {attr: unique.copy() for attr, unique in self._unique_indexes.items()}
+        return new
+    
+    
+    def to_numpy(self, attr):
+        """Returns the values of 'attr' for all the entries as a numpy array (requires numpy)."""
+        np = _import_numpy()
+        if np is None:
+            raise ImportError("to_numpy requires numpy to be installed")
+        # Always a copy: a view of a typed column would stop the book from growing while the view is alive
+        return np.array(self._get_column(attr))
+    
+    def to_arrow(self):
+        """Returns the whole book as a pyarrow Table with one column per attribute (requires pyarrow)."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("to_arrow requires pyarrow to be installed") from None
+        return pa.table({attr: self._to_arrow_array(pa, col) for attr, col in self._cols.items()})
+    
+    @staticmethod
+    def _to_arrow_array(pa, col):
+        if not isinstance(col, array.array):
+            return pa.array(col)
+        
+        # Typed columns keep their type (even when empty), and are passed as a single buffer instead of value by value
+        size = 8 * col.itemsize
+        if col.typecode in 'bhilq':
+            arrow_type = getattr(pa, f'int{size}')()
+        else:
+            arrow_type = getattr(pa, f'uint{size}')()
+        np = _import_numpy()
+        if np is not None:
+            return pa.array(np.array(col), type=arrow_type)  # a copy, so the book can keep growing
+        return pa.array(col, type=arrow_type)
     
     
     def print_book(self):
@@ -127,21 +485,37 @@ class BookBase:
         
     def __getitem__(self, key):
         """Allow to search by index."""
-        return self.entries[key]
+        if isinstance(key, slice):
+            return [self._entry_view(ix) for ix in range(*key.indices(self._length))]
+        
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        return self._entry_view(key)
+    
+    
+    def __iter__(self):
+        """Iterate over the entries, building each one only when it's reached."""
+        return (self._entry_view(ix) for ix in range(self._length))
+    
+    
+    def __len__(self):
+        return self._length
     
     
     def __repr__(self):
-        if self.entries:
-            return f"{self.__class__.__name__} ({len(self.entries)} entries of type '{self.ENTRY_TYPE.__name__}' with attributes {self.attributes})"
+        if self._length:
+            return f"{self.__class__.__name__} ({self._length} entries of type '{self.ENTRY_TYPE.__name__}' with attributes {self.attributes})"
         else:
             return f'{self.__class__.__name__} (Empty)'
     
     
     def __str__(self):
-        if self.entries:
-            ix_length = len(str(len(self.entries)))  # for better float/string formatting and divider size
-            s = '\n'.join(f'--- Entry #{ix:0{ix_length}} ---\n{entry}\n' for ix, entry in enumerate(self.entries, start=1))
-            s += '-' * (15 + ix_length)
+        if self._length:
+            ix_length = len(str(self._length))  # for better float/string formatting and divider size
+            parts = [f'--- Entry #{ix + 1:0{ix_length}} ---\n{self._entry_view(ix)}\n' for ix in range(self._length)]
+            s = '\n'.join(parts) + '-' * (15 + ix_length)
         else:
             s = "Your book has no entries yet"
         return s
@@ -149,6 +523,7 @@ class BookBase:
     
     ### A few aliases to make it easier
     new_contact = create_contact = add_contact
+    new_contacts = create_contacts = add_contacts
     search = find
     print = print_book
     get_copy = create_copy
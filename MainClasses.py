@@ -29,6 +29,7 @@ class PhoneBookExt(BookBase):
 class PhoneBookExt2(BookBase):
     """This class is a Phone book that holds entries with a name, phone number, email address and age."""
     ENTRY_TYPE = PhoneEntryExt2
+    COLUMN_TYPECODES = {'age': 'q'}
 
 
 